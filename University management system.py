@@ -1,16 +1,157 @@
 import datetime
-from typing import List, Dict, Optional
+import functools
+import re
+import sys
+from types import MappingProxyType
+from typing import Callable, List, Dict, Mapping, Optional, FrozenSet, Tuple
+
+import numpy as np
+
+# Attendance is stored per course as one byte per day of the academic year
+ACADEMIC_YEAR_DAYS = 366
+UNMARKED, PRESENT, ABSENT = 0, 1, 2
+
+# Per-student GPA and activity columns grow by this many rows at a time
+STUDENT_ARRAY_CHUNK = 1024
+
+# One comma-separated item with surrounding whitespace trimmed; empty items never match
+_LIST_ITEM_RE = re.compile(r'[^,\s](?:[^,]*[^,\s])?')
+
+
+def _optional_njit(func):
+    # numba is optional and slow to import, so it is only loaded the first time a kernel runs;
+    # without it the kernels run as plain NumPy code
+    compiled = None
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        nonlocal compiled
+        if compiled is None:
+            try:
+                from numba import njit
+            except ImportError:
+                compiled = func
+            else:
+                compiled = njit(cache=True)(func)
+        return compiled(*args)
+
+    return wrapper
+
+
+@_optional_njit
+def _gpa_kernel(grades: np.ndarray, credits: np.ndarray) -> float:
+    total_credits = credits.sum()
+    if total_credits <= 0:
+        return 0.0
+    return (grades * credits).sum() / total_credits
+
+
+@_optional_njit
+def _retention_kernel(active: np.ndarray) -> float:
+    if active.size == 0:
+        return 0.0
+    return active.sum() / active.size * 100.0
+
+
+@_optional_njit
+def _grad_kernel(gpas: np.ndarray) -> float:
+    if gpas.size == 0:
+        return 0.0
+    # Assuming 2.0 GPA is required for graduation
+    return (gpas >= 2.0).sum() / gpas.size * 100.0
+
+
+_MAIN_MENU = """
+--- University Management System ---
+1. Student Management
+2. Course Management
+3. Faculty Management
+4. Class Timetable and Scheduling
+5. Examination and Grading System
+6. Administration and Reporting
+7. Exit"""
+
+_STUDENT_MENU = """
+--- Student Management ---
+1. Add New Student
+2. Update Student Information
+3. View Student Profile
+4. Track Attendance
+5. View Academic Performance
+6. Back to Main Menu"""
+
+_COURSE_MENU = """
+--- Course Management ---
+1. Add New Course
+2. Modify Course
+3. Assign Faculty to Course
+4. Enroll Student in Course
+5. Remove Student from Course
+6. View Course Details
+7. Back to Main Menu"""
+
+_FACULTY_MENU = """
+--- Faculty Management ---
+1. Add New Faculty
+2. Update Faculty Records
+3. View Assigned Courses
+4. Set Faculty Availability
+5. Record Faculty Performance
+6. Back to Main Menu"""
+
+_SCHEDULE_MENU = """
+--- Class Timetable and Scheduling ---
+1. Generate Class Schedule
+2. Update Class Schedule
+3. View Class Schedule
+4. Back to Main Menu"""
+
+_EXAMINATION_MENU = """
+--- Examination and Grading System ---
+1. Record Exam Results
+2. Calculate GPA
+3. Generate Academic Performance Report
+4. Back to Main Menu"""
+
+_ADMINISTRATION_MENU = """
+--- Administration and Reporting ---
+1. Generate Enrollment Report
+2. Update Tuition Fees
+3. Update Scholarship
+4. Calculate Retention Rate
+5. Calculate Graduation Rate
+6. Back to Main Menu"""
 
 
 class Student:
+    __slots__ = ('student_id', 'name', 'address', 'courses', 'grades', 'attendance',
+                 '_att_present', '_att_total', 'gpa', '_weighted_points', '_total_credits_graded',
+                 '_graded_credits')
+
+    # Bulk loaders can switch this off to skip the per-record overwrite warning
+    WARN_OVERWRITE = True
+
     def __init__(self, student_id: str, name: str, address: str):
         self.student_id = student_id
         self.name = name
         self.address = address
-        self.courses: List[Course] = []
+        # Enrolled courses keyed by course_id, in enrollment order
+        self.courses: Dict[str, Course] = {}
         self.grades: Dict[str, float] = {}
-        self.attendance: Dict[str, Dict[datetime.date, bool]] = {}
+        self.attendance: Dict[str, np.ndarray] = {}
+        self._att_present: Dict[str, int] = {}
+        self._att_total: Dict[str, int] = {}
         self.gpa: float = 0.0
+        self._weighted_points = 0.0
+        self._total_credits_graded = 0.0
+        # Credits each grade was weighted with, so it can be taken back out exactly
+        self._graded_credits: Dict[str, int] = {}
+
+    def __eq__(self, other):
+        return isinstance(other, Student) and other.student_id == self.student_id
+
+    def __hash__(self):
+        return hash(self.student_id)
 
     def update_details(self, name: Optional[str] = None, address: Optional[str] = None):
         if name:
@@ -19,46 +160,75 @@ class Student:
             self.address = address
 
     def enroll_course(self, course: 'Course'):
-        if course not in self.courses:
-            self.courses.append(course)
-            self.attendance[course.course_id] = {}
+        if course.course_id not in self.courses:
+            self.courses[course.course_id] = course
+            self.attendance[course.course_id] = np.zeros(ACADEMIC_YEAR_DAYS, dtype=np.uint8)
+            self._att_present[course.course_id] = 0
+            self._att_total[course.course_id] = 0
 
     def record_grade(self, course: 'Course', grade: float):
+        old_grade = self.grades.get(course.course_id)
+        if old_grade is not None:
+            old_credits = self._graded_credits[course.course_id]
+            self._weighted_points -= old_grade * old_credits
+            self._total_credits_graded -= old_credits
         self.grades[course.course_id] = grade
-        self._update_gpa()
-
-    def mark_attendance(self, course: 'Course', date: datetime.date, present: bool):
-        if course.course_id not in self.attendance:
-            self.attendance[course.course_id] = {}
-        if date in self.attendance[course.course_id]:
-            print(f"Warning: Overwriting existing attendance record for {date}")
-        self.attendance[course.course_id][date] = present
-
-    def _update_gpa(self):
-        total_points = sum(grade * course.credits for course, grade in self.grades.items())
-        total_credits = sum(course.credits for course in self.courses)
-        self.gpa = total_points / total_credits if total_credits > 0 else 0.0
+        self._graded_credits[course.course_id] = course.credits
+        self._weighted_points += grade * course.credits
+        self._total_credits_graded += course.credits
+        self.gpa = self._weighted_points / self._total_credits_graded if self._total_credits_graded else 0.0
+
+    def mark_attendance(self, course: 'Course', date: datetime.date, present: bool,
+                        term_start: datetime.date) -> bool:
+        day = (date - term_start).days
+        if not 0 <= day < ACADEMIC_YEAR_DAYS:
+            print(f"Date {date} is outside the academic year starting {term_start}.")
+            return False
+        course_id = course.course_id
+        if course_id not in self.attendance:
+            self.attendance[course_id] = np.zeros(ACADEMIC_YEAR_DAYS, dtype=np.uint8)
+            self._att_present[course_id] = 0
+            self._att_total[course_id] = 0
+        record = self.attendance[course_id]
+        previous = record[day]
+        if previous == UNMARKED:
+            self._att_total[course_id] += 1
+        else:
+            if __debug__ and Student.WARN_OVERWRITE:
+                print(f"Warning: Overwriting existing attendance record for {date}")
+            if previous == PRESENT:
+                self._att_present[course_id] -= 1
+        record[day] = PRESENT if present else ABSENT
+        self._att_present[course_id] += int(present)
+        return True
 
     def get_attendance_percentage(self, course: 'Course') -> float:
-        course_attendance = self.attendance.get(course.course_id, {})
-        total_days = len(course_attendance)
-        days_present = sum(1 for present in course_attendance.values() if present)
+        total_days = self._att_total.get(course.course_id, 0)
+        days_present = self._att_present.get(course.course_id, 0)
         return (days_present / total_days * 100) if total_days > 0 else 0.0
 
 
 class Faculty:
+    __slots__ = ('faculty_id', 'name', 'courses_assigned', 'availability', 'performance_rating',
+                 'student_feedback')
+
     def __init__(self, faculty_id: str, name: str):
         self.faculty_id = faculty_id
         self.name = name
-        self.courses_assigned: List[Course] = []
+        self.courses_assigned: Dict[Course, None] = {}
         self.availability: Dict[str, List[str]] = {day: [] for day in
                                                    ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]}
         self.performance_rating: float = 0.0
         self.student_feedback: List[str] = []
 
+    def __eq__(self, other):
+        return isinstance(other, Faculty) and other.faculty_id == self.faculty_id
+
+    def __hash__(self):
+        return hash(self.faculty_id)
+
     def assign_course(self, course: 'Course'):
-        if course not in self.courses_assigned:
-            self.courses_assigned.append(course)
+        self.courses_assigned[course] = None
 
     def set_availability(self, day: str, times: List[str]):
         if day in self.availability:
@@ -72,47 +242,84 @@ class Faculty:
 
 
 class Course:
+    __slots__ = ('course_id', 'name', 'credits', 'schedule', 'prerequisites', '_prereqs_set', '_all_prereqs',
+                 'students', 'faculty')
+
     def __init__(self, course_id: str, name: str, credits: int, schedule: Dict[str, str],
                  prerequisites: Optional[List[str]] = None):
-        self.course_id = course_id
+        self.course_id = sys.intern(course_id)
         self.name = name
         self.credits = credits
         self.schedule = schedule
-        self.prerequisites = prerequisites or []
-        self.students: List[Student] = []
+        # Ordered for display; the frozenset is used for containment checks
+        self.prerequisites: Tuple[str, ...] = tuple(map(sys.intern, prerequisites or ()))
+        self._prereqs_set: FrozenSet[str] = frozenset(self.prerequisites)
+        # Transitive prerequisites, kept up to date by UniversitySystem
+        self._all_prereqs: FrozenSet[str] = self._prereqs_set
+        self.students: Dict[Student, None] = {}
         self.faculty: Optional[Faculty] = None
 
+    def __eq__(self, other):
+        return isinstance(other, Course) and other.course_id == self.course_id
+
+    def __hash__(self):
+        return hash(self.course_id)
+
     def assign_faculty(self, faculty: Faculty):
         self.faculty = faculty
 
     def enroll_student(self, student: Student):
-        if student not in self.students:
-            self.students.append(student)
+        self.students[student] = None
 
     def remove_student(self, student: Student):
-        if student in self.students:
-            self.students.remove(student)
+        self.students.pop(student, None)
 
     def modify_schedule(self, new_schedule: Dict[str, str]):
         self.schedule = new_schedule
 
+    def modify_prerequisites(self, prerequisites: List[str]):
+        self.prerequisites = tuple(map(sys.intern, prerequisites))
+        self._prereqs_set = frozenset(self.prerequisites)
+
     def notify_students(self, message: str):
-        for student in self.students:
-            print(f"Notification to {student.name}: {message}")
+        sys.stdout.write("".join(f"Notification to {student.name}: {message}\n" for student in self.students))
 
 
 class UniversitySystem:
-    def __init__(self):
+    def __init__(self, term_start: Optional[datetime.date] = None):
+        # Attendance covers one academic year from term_start; by default the one that
+        # began on the most recent 1 September
+        if term_start is None:
+            today = datetime.date.today()
+            term_start = datetime.date(today.year if today.month >= 9 else today.year - 1, 9, 1)
+        self.term_start = term_start
         self.students: Dict[str, Student] = {}
         self.courses: Dict[str, Course] = {}
         self.faculty: Dict[str, Faculty] = {}
         self.tuition_fees: Dict[str, float] = {}
         self.scholarships: Dict[str, float] = {}
+        self._prereqs_dirty = False
+        # (day, time) -> course_id of the course occupying that slot
+        self._slot_index: Dict[Tuple[str, str], str] = {}
+        self._schedule_cache: Optional[Mapping[str, Mapping[str, str]]] = None
+        self._schedule_dirty = True
+        # Column-wise GPA and "enrolled in any course" flags, one row per student
+        self._sid_to_idx: Dict[str, int] = {}
+        self._gpa_arr = np.zeros(STUDENT_ARRAY_CHUNK, dtype=np.float64)
+        self._active_arr = np.zeros(STUDENT_ARRAY_CHUNK, dtype=np.bool_)
 
     def add_student(self, student_id: str, name: str, address: str):
+        student_id = sys.intern(student_id)
         if student_id not in self.students:
             new_student = Student(student_id, name, address)
             self.students[student_id] = new_student
+            idx = len(self._sid_to_idx)
+            if idx == len(self._gpa_arr):
+                self._gpa_arr = np.resize(self._gpa_arr, idx + STUDENT_ARRAY_CHUNK)
+                self._active_arr = np.resize(self._active_arr, idx + STUDENT_ARRAY_CHUNK)
+            self._gpa_arr[idx] = 0.0
+            self._active_arr[idx] = False
+            self._sid_to_idx[student_id] = idx
             print(f"Student {name} added.")
         else:
             print(f"Student with ID {student_id} already exists.")
@@ -136,13 +343,38 @@ class UniversitySystem:
 
     def add_course(self, course_id: str, name: str, credits: int, schedule: Dict[str, str],
                    prerequisites: Optional[List[str]] = None):
+        course_id = sys.intern(course_id)
         if course_id not in self.courses:
+            conflict = self._find_schedule_conflict(course_id, schedule)
+            if conflict:
+                other_course, day, time = conflict
+                print(f"Scheduling conflict: {name} and {other_course.name} on {day} at {time}")
+                return
             new_course = Course(course_id, name, credits, schedule, prerequisites)
             self.courses[course_id] = new_course
+            self._index_schedule(course_id, {}, schedule)
+            self._prereqs_dirty = True
             print(f"Course {name} added.")
+            self._report_prerequisite_cycle(new_course)
         else:
             print(f"Course with ID {course_id} already exists.")
 
+    def _find_schedule_conflict(self, course_id: str,
+                                schedule: Dict[str, str]) -> Optional[Tuple[Course, str, str]]:
+        for day, time in schedule.items():
+            other_id = self._slot_index.get((day, time))
+            if other_id is not None and other_id != course_id:
+                return self.courses[other_id], day, time
+        return None
+
+    def _index_schedule(self, course_id: str, old_schedule: Dict[str, str], new_schedule: Dict[str, str]):
+        for slot in old_schedule.items():
+            if self._slot_index.get(slot) == course_id:
+                del self._slot_index[slot]
+        for slot in new_schedule.items():
+            self._slot_index[slot] = course_id
+        self._schedule_dirty = True
+
     def assign_faculty(self, course_id: str, faculty_id: str):
         if course_id in self.courses and faculty_id in self.faculty:
             faculty = self.faculty[faculty_id]
@@ -158,22 +390,95 @@ class UniversitySystem:
             student = self.students[student_id]
             course = self.courses[course_id]
 
-            # Check prerequisites
-            if all(prereq in [c.course_id for c in student.courses] for prereq in course.prerequisites):
+            # Check prerequisites, including those of the prerequisites
+            if self._prereqs_dirty:
+                self._update_prerequisite_closures()
+            if student.courses.keys() >= course._all_prereqs:
                 course.enroll_student(student)
                 student.enroll_course(course)
+                self._active_arr[self._sid_to_idx[student_id]] = True
                 print(f"Student {student.name} enrolled in course {course.name}.")
             else:
                 print(f"Student {student.name} does not meet prerequisites for course {course.name}.")
         else:
             print("Student or Course not found.")
 
+    def _update_prerequisite_closures(self):
+        # Tarjan's strongly connected components over the prerequisite graph, so that
+        # courses requiring each other in a cycle all get the same closure. The DFS keeps
+        # its own stack of (course_id, prerequisite iterator) so chain depth is unbounded.
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        partial: Dict[str, set] = {}
+        stack: List[str] = []
+        on_stack = set()
+
+        def open_course(course_id: str):
+            index[course_id] = lowlink[course_id] = len(index)
+            stack.append(course_id)
+            on_stack.add(course_id)
+            partial[course_id] = set(self.courses[course_id]._prereqs_set)
+            work.append((course_id, iter(self.courses[course_id]._prereqs_set)))
+
+        for root in self.courses:
+            if root in index:
+                continue
+            work = []
+            open_course(root)
+            while work:
+                course_id, prereqs = work[-1]
+                for prereq in prereqs:
+                    if prereq not in self.courses:
+                        continue
+                    if prereq not in index:
+                        open_course(prereq)
+                        break
+                    if prereq in on_stack:
+                        lowlink[course_id] = min(lowlink[course_id], index[prereq])
+                    else:
+                        partial[course_id] |= self.courses[prereq]._all_prereqs
+                else:
+                    work.pop()
+                    if lowlink[course_id] == index[course_id]:
+                        members = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            members.append(member)
+                            if member == course_id:
+                                break
+                        closure = frozenset().union(*(partial[member] for member in members))
+                        for member in members:
+                            self.courses[member]._all_prereqs = closure
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[course_id])
+                        if course_id not in on_stack:
+                            partial[parent] |= self.courses[course_id]._all_prereqs
+        self._prereqs_dirty = False
+
+    def _report_prerequisite_cycle(self, course: Course):
+        # Any new cycle passes through the course just added or changed, so it is enough
+        # to check whether the course can reach itself through its prerequisites
+        seen = set()
+        pending = list(course._prereqs_set)
+        while pending:
+            prereq = pending.pop()
+            if prereq == course.course_id:
+                print(f"Warning: prerequisites of {course.name} form a cycle; no student can meet them.")
+                return
+            if prereq in seen or prereq not in self.courses:
+                continue
+            seen.add(prereq)
+            pending.extend(self.courses[prereq]._prereqs_set)
+
     def remove_student_from_course(self, student_id: str, course_id: str):
         if student_id in self.students and course_id in self.courses:
             student = self.students[student_id]
             course = self.courses[course_id]
             course.remove_student(student)
-            student.courses = [c for c in student.courses if c.course_id != course_id]
+            student.courses.pop(course_id, None)
+            self._active_arr[self._sid_to_idx[student_id]] = bool(student.courses)
             print(f"Student {student.name} removed from course {course.name}.")
         else:
             print("Student or Course not found.")
@@ -183,11 +488,13 @@ class UniversitySystem:
             student = self.students[student_id]
             course = self.courses[course_id]
             student.record_grade(course, grade)
+            self._gpa_arr[self._sid_to_idx[student_id]] = student.gpa
             print(f"Grade {grade} recorded for {student.name} in {course.name}.")
         else:
             print("Student or Course not found.")
 
     def add_faculty(self, faculty_id: str, name: str):
+        faculty_id = sys.intern(faculty_id)
         if faculty_id not in self.faculty:
             new_faculty = Faculty(faculty_id, name)
             self.faculty[faculty_id] = new_faculty
@@ -196,32 +503,60 @@ class UniversitySystem:
             print(f"Faculty with ID {faculty_id} already exists.")
 
     def modify_course(self, course_id: str, name: Optional[str] = None, credits: Optional[int] = None,
-                      schedule: Optional[Dict[str, str]] = None):
+                      schedule: Optional[Dict[str, str]] = None, prerequisites: Optional[List[str]] = None):
         if course_id in self.courses:
             course = self.courses[course_id]
+            if schedule:
+                conflict = self._find_schedule_conflict(course_id, schedule)
+                if conflict:
+                    other_course, day, time = conflict
+                    print(f"Scheduling conflict: {course.name} and {other_course.name} on {day} at {time}")
+                    return
+                self._index_schedule(course_id, course.schedule, schedule)
+                course.modify_schedule(schedule)
             if name:
                 course.name = name
-            if credits is not None:
+                self._schedule_dirty = True
+            if credits is not None and credits != course.credits:
                 course.credits = credits
-            if schedule:
-                course.modify_schedule(schedule)
+                # Re-record existing grades so they are weighted with the new credits
+                for student in self.students.values():
+                    if course_id in student.grades:
+                        student.record_grade(course, student.grades[course_id])
+                        self._gpa_arr[self._sid_to_idx[student.student_id]] = student.gpa
+            if prerequisites is not None:
+                course.modify_prerequisites(prerequisites)
+                self._prereqs_dirty = True
             print(f"Course {course_id} modified.")
+            if prerequisites is not None:
+                self._report_prerequisite_cycle(course)
         else:
             print("Course not found.")
 
+    def _recalculate_gpa(self, student: Student):
+        course_ids = list(student.grades)
+        grades = np.array([student.grades[course_id] for course_id in course_ids], dtype=np.float64)
+        credits = np.array([self.courses[course_id].credits for course_id in course_ids], dtype=np.float64)
+        student.gpa = float(_gpa_kernel(grades, credits))
+        student._total_credits_graded = float(credits.sum())
+        student._weighted_points = student.gpa * student._total_credits_graded
+        student._graded_credits = {course_id: self.courses[course_id].credits for course_id in course_ids}
+        self._gpa_arr[self._sid_to_idx[student.student_id]] = student.gpa
+
     def generate_report(self):
-        print("\nUniversity Report:")
-        print(f"Total Students: {len(self.students)}")
-        print(f"Total Courses: {len(self.courses)}")
-        print(f"Total Faculty: {len(self.faculty)}")
+        parts = ["\nUniversity Report:\n",
+                 f"Total Students: {len(self.students)}\n",
+                 f"Total Courses: {len(self.courses)}\n",
+                 f"Total Faculty: {len(self.faculty)}\n"]
         for course_id, course in self.courses.items():
-            print(f"\nCourse: {course.name}")
-            print(f"Faculty: {course.faculty.name if course.faculty else 'Not assigned'}")
-            print(f"Enrolled Students: {len(course.students)}")
+            parts.append(f"\nCourse: {course.name}\n")
+            parts.append(f"Faculty: {course.faculty.name if course.faculty else 'Not assigned'}\n")
+            parts.append(f"Enrolled Students: {len(course.students)}\n")
             for student in course.students:
                 grade = student.grades.get(course_id, "Not graded")
                 attendance = student.get_attendance_percentage(course)
-                print(f" - {student.name}, Grade: {grade}, Attendance: {attendance:.2f}%")
+                parts.append(f" - {student.name}, Grade: {grade}, Attendance: {attendance:.2f}%\n")
+        sys.stdout.write("".join(parts))
 
     def update_tuition_fees(self, course_id: str, new_fee: float):
         if course_id in self.courses:
@@ -237,30 +572,32 @@ class UniversitySystem:
         else:
             print("Student not found.")
 
-    def generate_class_schedule(self):
-        schedule = {day: {} for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]}
-        for course in self.courses.values():
-            for day, time in course.schedule.items():
-                if time in schedule[day]:
-                    print(f"Scheduling conflict: {course.name} on {day} at {time}")
-                else:
-                    schedule[day][time] = course.name
-        return schedule
+    def generate_class_schedule(self) -> Mapping[str, Mapping[str, str]]:
+        # Rebuilt only after a schedule or course name has changed; the result is a
+        # read-only view, so the cached grid can be handed out without copying
+        if self._schedule_dirty:
+            schedule = {day: {} for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday"]}
+            # Conflicting courses are rejected on entry, so every slot holds a single course
+            for (day, time), course_id in self._slot_index.items():
+                schedule.setdefault(day, {})[time] = self.courses[course_id].name
+            self._schedule_cache = MappingProxyType(
+                {day: MappingProxyType(times) for day, times in schedule.items()})
+            self._schedule_dirty = False
+        return self._schedule_cache
 
     def update_class_schedule(self, course_id: str, new_schedule: Dict[str, str]):
         if course_id in self.courses:
             course = self.courses[course_id]
-            old_schedule = course.schedule
-            course.modify_schedule(new_schedule)
 
             # Check for conflicts
-            for day, time in new_schedule.items():
-                for other_course in self.courses.values():
-                    if other_course != course and other_course.schedule.get(day) == time:
-                        print(f"Scheduling conflict: {course.name} and {other_course.name} on {day} at {time}")
-                        course.modify_schedule(old_schedule)
-                        return
+            conflict = self._find_schedule_conflict(course_id, new_schedule)
+            if conflict:
+                other_course, day, time = conflict
+                print(f"Scheduling conflict: {course.name} and {other_course.name} on {day} at {time}")
+                return
 
+            self._index_schedule(course_id, course.schedule, new_schedule)
+            course.modify_schedule(new_schedule)
             print(f"Schedule updated for course {course.name}")
             course.notify_students(f"Schedule for {course.name} has been updated.")
         else:
@@ -268,351 +605,339 @@ class UniversitySystem:
 
     def calculate_retention_rate(self) -> float:
         # Simplified retention rate calculation
-        total_students = len(self.students)
-        active_students = sum(1 for student in self.students.values() if student.courses)
-        return (active_students / total_students) * 100 if total_students > 0 else 0
+        return float(_retention_kernel(self._active_arr[:len(self._sid_to_idx)]))
 
     def calculate_graduation_rate(self) -> float:
         # Simplified graduation rate calculation
-        total_students = len(self.students)
-        graduated_students = sum(1 for student in self.students.values() if
-                                 student.gpa >= 2.0)  # Assuming 2.0 GPA is required for graduation
-        return (graduated_students / total_students) * 100 if total_students > 0 else 0
+        return float(_grad_kernel(self._gpa_arr[:len(self._sid_to_idx)]))
 
     def generate_performance_report(self):
-        report = "Academic Performance Report\n"
-        report += "===========================\n"
+        parts = ["Academic Performance Report\n",
+                 "===========================\n"]
         for student in self.students.values():
-            report += f"Student: {student.name} (ID: {student.student_id})\n"
-            report += f"GPA: {student.gpa:.2f}\n"
-            for course in student.courses:
+            parts.append(f"Student: {student.name} (ID: {student.student_id})\n")
+            parts.append(f"GPA: {student.gpa:.2f}\n")
+            for course in student.courses.values():
                 grade = student.grades.get(course.course_id, "Not graded")
                 attendance = student.get_attendance_percentage(course)
-                report += f"  Course: {course.name}, Grade: {grade}, Attendance: {attendance:.2f}%\n"
-            report += "\n"
-        return report
+                parts.append(f"  Course: {course.name}, Grade: {grade}, Attendance: {attendance:.2f}%\n")
+            parts.append("\n")
+        return "".join(parts)
 
-    def display_menu(self):
+    def _run_menu(self, menu: str, prompt: str, commands: Dict[str, Callable[['UniversitySystem'], None]],
+                  back_choice: str):
         while True:
-            print("\n--- University Management System ---")
-            print("1. Student Management")
-            print("2. Course Management")
-            print("3. Faculty Management")
-            print("4. Class Timetable and Scheduling")
-            print("5. Examination and Grading System")
-            print("6. Administration and Reporting")
-            print("7. Exit")
-
-            choice = input("Select an option (1-7): ")
-
-            if choice == '1':
-                self.student_management_menu()
-            elif choice == '2':
-                self.course_management_menu()
-            elif choice == '3':
-                self.faculty_management_menu()
-            elif choice == '4':
-                self.schedule_management_menu()
-            elif choice == '5':
-                self.examination_management_menu()
-            elif choice == '6':
-                self.administration_management_menu()
-            elif choice == '7':
-                print("Exiting the system. Goodbye!")
+            print(menu)
+
+            choice = input(prompt)
+
+            if choice == back_choice:
                 break
-            else:
+            command = commands.get(choice)
+            if command is None:
                 print("Invalid choice. Please try again.")
+            else:
+                command(self)
+
+    def display_menu(self):
+        self._run_menu(_MAIN_MENU, "Select an option (1-7): ", self._MAIN_COMMANDS, '7')
+        print("Exiting the system. Goodbye!")
+
+    def _add_student_cmd(self):
+        student_id = input("Enter student ID: ")
+        name = input("Enter student name: ")
+        address = input("Enter student address: ")
+        self.add_student(student_id, name, address)
+
+    def _update_student_cmd(self):
+        student_id = input("Enter student ID to update: ")
+        name = input("Enter new name (leave blank if no change): ")
+        address = input("Enter new address (leave blank if no change): ")
+        self.update_student(student_id, name=name or None, address=address or None)
+
+    def _view_student_cmd(self):
+        student_id = input("Enter student ID to view: ")
+        student = self.search_student(student_id)
+        if student:
+            print(f"Enrolled Courses: {', '.join(course.name for course in student.courses.values())}")
+            print(f"GPA: {student.gpa:.2f}")
+
+    def _track_attendance_cmd(self):
+        student_id = input("Enter student ID to track attendance: ")
+        course_id = input("Enter course ID: ")
+        date_str = input("Enter date (YYYY-MM-DD): ")
+        present = input("Is the student present? (yes/no): ").lower() == 'yes'
+        if student_id in self.students and course_id in self.courses:
+            student = self.students[student_id]
+            course = self.courses[course_id]
+            date = datetime.date.fromisoformat(date_str)
+            if student.mark_attendance(course, date, present, self.term_start):
+                print(f"Attendance marked for {student_id} in course {course_id} on {date_str}.")
+        else:
+            print("Student or Course not found.")
+
+    def _view_student_performance_cmd(self):
+        student_id = input("Enter student ID to view academic performance: ")
+        if student_id in self.students:
+            student = self.students[student_id]
+            print(f"Academic Performance for {student.name}:")
+            print(f"GPA: {student.gpa:.2f}")
+            for course in student.courses.values():
+                grade = student.grades.get(course.course_id, "Not graded")
+                attendance = student.get_attendance_percentage(course)
+                print(f"Course: {course.name}, Grade: {grade}, Attendance: {attendance:.2f}%")
+        else:
+            print("Student not found.")
+
+    _STUDENT_COMMANDS = {
+        '1': _add_student_cmd,
+        '2': _update_student_cmd,
+        '3': _view_student_cmd,
+        '4': _track_attendance_cmd,
+        '5': _view_student_performance_cmd,
+    }
 
     def student_management_menu(self):
+        self._run_menu(_STUDENT_MENU, "Select an option (1-6): ", self._STUDENT_COMMANDS, '6')
+
+    def _add_course_cmd(self):
+        course_id = input("Enter course ID: ")
+        name = input("Enter course name: ")
+        credits = int(input("Enter course credits: "))
+        schedule = {}
         while True:
-            print("\n--- Student Management ---")
-            print("1. Add New Student")
-            print("2. Update Student Information")
-            print("3. View Student Profile")
-            print("4. Track Attendance")
-            print("5. View Academic Performance")
-            print("6. Back to Main Menu")
-
-            choice = input("Select an option (1-6): ")
-
-            if choice == '1':
-                student_id = input("Enter student ID: ")
-                name = input("Enter student name: ")
-                address = input("Enter student address: ")
-                self.add_student(student_id, name, address)
-            elif choice == '2':
-                student_id = input("Enter student ID to update: ")
-                name = input("Enter new name (leave blank if no change): ")
-                address = input("Enter new address (leave blank if no change): ")
-                self.update_student(student_id, name=name or None, address=address or None)
-            elif choice == '3':
-                student_id = input("Enter student ID to view: ")
-                student = self.search_student(student_id)
-                if student:
-                    print(f"Enrolled Courses: {', '.join(course.name for course in student.courses)}")
-                    print(f"GPA: {student.gpa:.2f}")
-            elif choice == '4':
-                student_id = input("Enter student ID to track attendance: ")
-                course_id = input("Enter course ID: ")
-                date_str = input("Enter date (YYYY-MM-DD): ")
-                present = input("Is the student present? (yes/no): ").lower() == 'yes'
-                if student_id in self.students and course_id in self.courses:
-                    student = self.students[student_id]
-                    course = self.courses[course_id]
-                    date = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-                    student.mark_attendance(course, date, present)
-                    print(f"Attendance marked for {student_id} in course {course_id} on {date_str}.")
-                else:
-                    print("Student or Course not found.")
-            elif choice == '5':
-                student_id = input("Enter student ID to view academic performance: ")
-                if student_id in self.students:
-                    student = self.students[student_id]
-                    print(f"Academic Performance for {student.name}:")
-                    print(f"GPA: {student.gpa:.2f}")
-                    for course in student.courses:
-                        grade = student.grades.get(course.course_id, "Not graded")
-                        attendance = student.get_attendance_percentage(course)
-                        print(f"Course: {course.name}, Grade: {grade}, Attendance: {attendance:.2f}%")
-                else:
-                    print("Student not found.")
-            elif choice == '6':
+            day = input("Enter day (or 'done' to finish): ")
+            if day.lower() == 'done':
                 break
-            else:
-                print("Invalid choice. Please try again.")
-
-    def course_management_menu(self):
+            time = input(f"Enter time for {day}: ")
+            schedule[day] = time
+        prerequisites = _LIST_ITEM_RE.findall(
+            input("Enter prerequisite course IDs (comma-separated, or leave blank): "))
+        self.add_course(course_id, name, credits, schedule, prerequisites)
+
+    def _modify_course_cmd(self):
+        course_id = input("Enter course ID to modify: ")
+        name = input("Enter new course name (leave blank if no change): ")
+        credits = input("Enter new course credits (leave blank if no change): ")
+        schedule = {}
         while True:
-            print("\n--- Course Management ---")
-            print("1. Add New Course")
-            print("2. Modify Course")
-            print("3. Assign Faculty to Course")
-            print("4. Enroll Student in Course")
-            print("5. Remove Student from Course")
-            print("6. View Course Details")
-            print("7. Back to Main Menu")
-
-            choice = input("Select an option (1-7): ")
-
-            if choice == '1':
-                course_id = input("Enter course ID: ")
-                name = input("Enter course name: ")
-                credits = int(input("Enter course credits: "))
-                schedule = {}
-                while True:
-                    day = input("Enter day (or 'done' to finish): ")
-                    if day.lower() == 'done':
-                        break
-                    time = input(f"Enter time for {day}: ")
-                    schedule[day] = time
-                prerequisites = input("Enter prerequisite course IDs (comma-separated, or leave blank): ").split(
-                    ',')
-                prerequisites = [p.strip() for p in prerequisites if p.strip()]
-                self.add_course(course_id, name, credits, schedule, prerequisites)
-            elif choice == '2':
-                course_id = input("Enter course ID to modify: ")
-                name = input("Enter new course name (leave blank if no change): ")
-                credits = input("Enter new course credits (leave blank if no change): ")
-                schedule = {}
-                while True:
-                    day = input("Enter day to update schedule (or 'done' to finish): ")
-                    if day.lower() == 'done':
-                        break
-                    time = input(f"Enter new time for {day}: ")
-                    schedule[day] = time
-                self.modify_course(course_id, name=name or None, credits=int(credits) if credits else None,
-                                   schedule=schedule or None)
-            elif choice == '3':
-                course_id = input("Enter course ID: ")
-                faculty_id = input("Enter faculty ID: ")
-                self.assign_faculty(course_id, faculty_id)
-            elif choice == '4':
-                student_id = input("Enter student ID: ")
-                course_id = input("Enter course ID: ")
-                self.enroll_student_in_course(student_id, course_id)
-            elif choice == '5':
-                student_id = input("Enter student ID: ")
-                course_id = input("Enter course ID: ")
-                self.remove_student_from_course(student_id, course_id)
-            elif choice == '6':
-                course_id = input("Enter course ID to view details: ")
-                if course_id in self.courses:
-                    course = self.courses[course_id]
-                    print(f"Course: {course.name} (ID: {course.course_id})")
-                    print(f"Credits: {course.credits}")
-                    print(f"Schedule: {course.schedule}")
-                    print(f"Prerequisites: {', '.join(course.prerequisites)}")
-                    print(f"Enrolled Students: {len(course.students)}")
-                    print(f"Faculty: {course.faculty.name if course.faculty else 'Not assigned'}")
-                else:
-                    print("Course not found.")
-            elif choice == '7':
+            day = input("Enter day to update schedule (or 'done' to finish): ")
+            if day.lower() == 'done':
                 break
-            else:
-                print("Invalid choice. Please try again.")
+            time = input(f"Enter new time for {day}: ")
+            schedule[day] = time
+        prerequisites = input("Enter new prerequisite course IDs "
+                              "(comma-separated, 'none' to clear, leave blank if no change): ")
+        if prerequisites.strip().lower() == 'none':
+            prerequisites = []
+        else:
+            prerequisites = _LIST_ITEM_RE.findall(prerequisites) or None
+        self.modify_course(course_id, name=name or None, credits=int(credits) if credits else None,
+                           schedule=schedule or None, prerequisites=prerequisites)
+
+    def _assign_faculty_cmd(self):
+        course_id = input("Enter course ID: ")
+        faculty_id = input("Enter faculty ID: ")
+        self.assign_faculty(course_id, faculty_id)
+
+    def _enroll_student_cmd(self):
+        student_id = input("Enter student ID: ")
+        course_id = input("Enter course ID: ")
+        self.enroll_student_in_course(student_id, course_id)
+
+    def _remove_student_cmd(self):
+        student_id = input("Enter student ID: ")
+        course_id = input("Enter course ID: ")
+        self.remove_student_from_course(student_id, course_id)
+
+    def _view_course_cmd(self):
+        course_id = input("Enter course ID to view details: ")
+        if course_id in self.courses:
+            course = self.courses[course_id]
+            print(f"Course: {course.name} (ID: {course.course_id})")
+            print(f"Credits: {course.credits}")
+            print(f"Schedule: {course.schedule}")
+            print(f"Prerequisites: {', '.join(course.prerequisites)}")
+            print(f"Enrolled Students: {len(course.students)}")
+            print(f"Faculty: {course.faculty.name if course.faculty else 'Not assigned'}")
+        else:
+            print("Course not found.")
+
+    _COURSE_COMMANDS = {
+        '1': _add_course_cmd,
+        '2': _modify_course_cmd,
+        '3': _assign_faculty_cmd,
+        '4': _enroll_student_cmd,
+        '5': _remove_student_cmd,
+        '6': _view_course_cmd,
+    }
+
+    def course_management_menu(self):
+        self._run_menu(_COURSE_MENU, "Select an option (1-7): ", self._COURSE_COMMANDS, '7')
+
+    def _add_faculty_cmd(self):
+        faculty_id = input("Enter faculty ID: ")
+        name = input("Enter faculty name: ")
+        self.add_faculty(faculty_id, name)
+
+    def _update_faculty_cmd(self):
+        faculty_id = input("Enter faculty ID to update: ")
+        name = input("Enter new name (leave blank if no change): ")
+        if faculty_id in self.faculty:
+            faculty = self.faculty[faculty_id]
+            if name:
+                faculty.name = name
+            print(f"Faculty {faculty_id} updated.")
+        else:
+            print("Faculty not found.")
+
+    def _view_faculty_courses_cmd(self):
+        faculty_id = input("Enter faculty ID to view courses: ")
+        if faculty_id in self.faculty:
+            faculty = self.faculty[faculty_id]
+            print(f"Courses assigned to {faculty.name}:")
+            for course in faculty.courses_assigned:
+                print(f"- {course.name} (ID: {course.course_id})")
+        else:
+            print("Faculty not found.")
+
+    def _set_faculty_availability_cmd(self):
+        faculty_id = input("Enter faculty ID to set availability: ")
+        if faculty_id in self.faculty:
+            faculty = self.faculty[faculty_id]
+            day = input("Enter day to set availability: ")
+            times = _LIST_ITEM_RE.findall(input("Enter available times (comma-separated): "))
+            faculty.set_availability(day, times)
+            print(f"Availability set for {faculty.name} on {day}.")
+        else:
+            print("Faculty not found.")
+
+    def _record_faculty_performance_cmd(self):
+        faculty_id = input("Enter faculty ID to record performance: ")
+        if faculty_id in self.faculty:
+            faculty = self.faculty[faculty_id]
+            rating = float(input("Enter performance rating (0-5): "))
+            feedback = input("Enter student feedback: ")
+            faculty.update_performance_rating(rating)
+            faculty.add_student_feedback(feedback)
+            print(f"Performance recorded for {faculty.name}.")
+        else:
+            print("Faculty not found.")
+
+    _FACULTY_COMMANDS = {
+        '1': _add_faculty_cmd,
+        '2': _update_faculty_cmd,
+        '3': _view_faculty_courses_cmd,
+        '4': _set_faculty_availability_cmd,
+        '5': _record_faculty_performance_cmd,
+    }
 
     def faculty_management_menu(self):
+        self._run_menu(_FACULTY_MENU, "Select an option (1-6): ", self._FACULTY_COMMANDS, '6')
+
+    def _generate_schedule_cmd(self):
+        schedule = self.generate_class_schedule()
+        print("\nGenerated Class Schedule:")
+        for day, times in schedule.items():
+            print(f"{day}:")
+            for time, course in times.items():
+                print(f"  {time}: {course}")
+
+    def _update_schedule_cmd(self):
+        course_id = input("Enter course ID to update schedule: ")
+        new_schedule = {}
         while True:
-            print("\n--- Faculty Management ---")
-            print("1. Add New Faculty")
-            print("2. Update Faculty Records")
-            print("3. View Assigned Courses")
-            print("4. Set Faculty Availability")
-            print("5. Record Faculty Performance")
-            print("6. Back to Main Menu")
-
-            choice = input("Select an option (1-6): ")
-
-            if choice == '1':
-                faculty_id = input("Enter faculty ID: ")
-                name = input("Enter faculty name: ")
-                self.add_faculty(faculty_id, name)
-            elif choice == '2':
-                faculty_id = input("Enter faculty ID to update: ")
-                name = input("Enter new name (leave blank if no change): ")
-                if faculty_id in self.faculty:
-                    faculty = self.faculty[faculty_id]
-                    if name:
-                        faculty.name = name
-                    print(f"Faculty {faculty_id} updated.")
-                else:
-                    print("Faculty not found.")
-            elif choice == '3':
-                faculty_id = input("Enter faculty ID to view courses: ")
-                if faculty_id in self.faculty:
-                    faculty = self.faculty[faculty_id]
-                    print(f"Courses assigned to {faculty.name}:")
-                    for course in faculty.courses_assigned:
-                        print(f"- {course.name} (ID: {course.course_id})")
-                else:
-                    print("Faculty not found.")
-            elif choice == '4':
-                faculty_id = input("Enter faculty ID to set availability: ")
-                if faculty_id in self.faculty:
-                    faculty = self.faculty[faculty_id]
-                    day = input("Enter day to set availability: ")
-                    times = input("Enter available times (comma-separated): ").split(',')
-                    faculty.set_availability(day, [t.strip() for t in times])
-                    print(f"Availability set for {faculty.name} on {day}.")
-                else:
-                    print("Faculty not found.")
-            elif choice == '5':
-                faculty_id = input("Enter faculty ID to record performance: ")
-                if faculty_id in self.faculty:
-                    faculty = self.faculty[faculty_id]
-                    rating = float(input("Enter performance rating (0-5): "))
-                    feedback = input("Enter student feedback: ")
-                    faculty.update_performance_rating(rating)
-                    faculty.add_student_feedback(feedback)
-                    print(f"Performance recorded for {faculty.name}.")
-                else:
-                    print("Faculty not found.")
-            elif choice == '6':
+            day = input("Enter day (or 'done' to finish): ")
+            if day.lower() == 'done':
                 break
-            else:
-                print("Invalid choice. Please try again.")
+            time = input(f"Enter time for {day}: ")
+            new_schedule[day] = time
+        self.update_class_schedule(course_id, new_schedule)
+
+    def _view_schedule_cmd(self):
+        print("\nCurrent Class Schedule:")
+        for course in self.courses.values():
+            print(f"{course.name} (ID: {course.course_id}):")
+            for day, time in course.schedule.items():
+                print(f"  {day}: {time}")
+
+    _SCHEDULE_COMMANDS = {
+        '1': _generate_schedule_cmd,
+        '2': _update_schedule_cmd,
+        '3': _view_schedule_cmd,
+    }
 
     def schedule_management_menu(self):
-        while True:
-            print("\n--- Class Timetable and Scheduling ---")
-            print("1. Generate Class Schedule")
-            print("2. Update Class Schedule")
-            print("3. View Class Schedule")
-            print("4. Back to Main Menu")
-
-            choice = input("Select an option (1-4): ")
-
-            if choice == '1':
-                schedule = self.generate_class_schedule()
-                print("\nGenerated Class Schedule:")
-                for day, times in schedule.items():
-                    print(f"{day}:")
-                    for time, course in times.items():
-                        print(f"  {time}: {course}")
-            elif choice == '2':
-                course_id = input("Enter course ID to update schedule: ")
-                new_schedule = {}
-                while True:
-                    day = input("Enter day (or 'done' to finish): ")
-                    if day.lower() == 'done':
-                        break
-                    time = input(f"Enter time for {day}: ")
-                    new_schedule[day] = time
-                self.update_class_schedule(course_id, new_schedule)
-            elif choice == '3':
-                print("\nCurrent Class Schedule:")
-                for course in self.courses.values():
-                    print(f"{course.name} (ID: {course.course_id}):")
-                    for day, time in course.schedule.items():
-                        print(f"  {day}: {time}")
-            elif choice == '4':
-                break
-            else:
-                print("Invalid choice. Please try again.")
+        self._run_menu(_SCHEDULE_MENU, "Select an option (1-4): ", self._SCHEDULE_COMMANDS, '4')
 
-    def examination_management_menu(self):
-        while True:
-            print("\n--- Examination and Grading System ---")
-            print("1. Record Exam Results")
-            print("2. Calculate GPA")
-            print("3. Generate Academic Performance Report")
-            print("4. Back to Main Menu")
-
-            choice = input("Select an option (1-4): ")
-
-            if choice == '1':
-                student_id = input("Enter student ID: ")
-                course_id = input("Enter course ID: ")
-                grade = float(input("Enter exam grade: "))
-                self.record_student_grade(student_id, course_id, grade)
-            elif choice == '2':
-                student_id = input("Enter student ID to calculate GPA: ")
-                if student_id in self.students:
-                    student = self.students[student_id]
-                    print(f"GPA for {student.name}: {student.gpa:.2f}")
-                else:
-                    print("Student not found.")
-            elif choice == '3':
-                report = self.generate_performance_report()
-                print(report)
-            elif choice == '4':
-                break
-            else:
-                print("Invalid choice. Please try again.")
+    def _record_exam_results_cmd(self):
+        student_id = input("Enter student ID: ")
+        course_id = input("Enter course ID: ")
+        grade = float(input("Enter exam grade: "))
+        self.record_student_grade(student_id, course_id, grade)
 
-    def administration_management_menu(self):
-        while True:
-            print("\n--- Administration and Reporting ---")
-            print("1. Generate Enrollment Report")
-            print("2. Update Tuition Fees")
-            print("3. Update Scholarship")
-            print("4. Calculate Retention Rate")
-            print("5. Calculate Graduation Rate")
-            print("6. Back to Main Menu")
-
-            choice = input("Select an option (1-6): ")
-
-            if choice == '1':
-                self.generate_report()
-            elif choice == '2':
-                course_id = input("Enter course ID to update tuition fee: ")
-                new_fee = float(input("Enter new tuition fee: "))
-                self.update_tuition_fees(course_id, new_fee)
-            elif choice == '3':
-                student_id = input("Enter student ID for scholarship update: ")
-                amount = float(input("Enter scholarship amount: "))
-                self.update_scholarship(student_id, amount)
-            elif choice == '4':
-                retention_rate = self.calculate_retention_rate()
-                print(f"Current retention rate: {retention_rate:.2f}%")
-            elif choice == '5':
-                graduation_rate = self.calculate_graduation_rate()
-                print(f"Current graduation rate: {graduation_rate:.2f}%")
-            elif choice == '6':
-                break
-            else:
-                print("Invalid choice. Please try again.")
+    def _calculate_gpa_cmd(self):
+        student_id = input("Enter student ID to calculate GPA: ")
+        if student_id in self.students:
+            student = self.students[student_id]
+            self._recalculate_gpa(student)
+            print(f"GPA for {student.name}: {student.gpa:.2f}")
+        else:
+            print("Student not found.")
+
+    def _performance_report_cmd(self):
+        report = self.generate_performance_report()
+        print(report)
 
+    _EXAMINATION_COMMANDS = {
+        '1': _record_exam_results_cmd,
+        '2': _calculate_gpa_cmd,
+        '3': _performance_report_cmd,
+    }
 
-university_system = UniversitySystem()
-university_system.display_menu()
\ No newline at end of file
+    def examination_management_menu(self):
+        self._run_menu(_EXAMINATION_MENU, "Select an option (1-4): ", self._EXAMINATION_COMMANDS, '4')
+
+    def _update_tuition_fees_cmd(self):
+        course_id = input("Enter course ID to update tuition fee: ")
+        new_fee = float(input("Enter new tuition fee: "))
+        self.update_tuition_fees(course_id, new_fee)
+
+    def _update_scholarship_cmd(self):
+        student_id = input("Enter student ID for scholarship update: ")
+        amount = float(input("Enter scholarship amount: "))
+        self.update_scholarship(student_id, amount)
+
+    def _retention_rate_cmd(self):
+        retention_rate = self.calculate_retention_rate()
+        print(f"Current retention rate: {retention_rate:.2f}%")
+
+    def _graduation_rate_cmd(self):
+        graduation_rate = self.calculate_graduation_rate()
+        print(f"Current graduation rate: {graduation_rate:.2f}%")
+
+    _ADMINISTRATION_COMMANDS = {
+        '1': generate_report,
+        '2': _update_tuition_fees_cmd,
+        '3': _update_scholarship_cmd,
+        '4': _retention_rate_cmd,
+        '5': _graduation_rate_cmd,
+    }
+
+    def administration_management_menu(self):
+        self._run_menu(_ADMINISTRATION_MENU, "Select an option (1-6): ", self._ADMINISTRATION_COMMANDS, '6')
+
+    _MAIN_COMMANDS = {
+        '1': student_management_menu,
+        '2': course_management_menu,
+        '3': faculty_management_menu,
+        '4': schedule_management_menu,
+        '5': examination_management_menu,
+        '6': administration_management_menu,
+    }
+
+
+if __name__ == "__main__":
+    # Optional argument: first day of the academic year (YYYY-MM-DD)
+    term_start = datetime.date.fromisoformat(sys.argv[1]) if len(sys.argv) > 1 else None
+    UniversitySystem(term_start).display_menu()
\ No newline at end of file